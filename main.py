@@ -1,15 +1,29 @@
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+import httpx
+import hishel
+import asyncio
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+from selectolax.lexbor import LexborHTMLParser
 import pandas as pd
-import json
+import orjson
 import csv
+from itertools import chain
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Union
 from urllib.parse import urljoin, urlparse
 import re
+import codecs
+import random
 from dataclasses import dataclass
+from collections import Counter
 from pathlib import Path
 import sqlite3
 from fake_useragent import UserAgent
@@ -19,75 +33,302 @@ from datetime import timedelta
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Tamanho do buffer circular de user agents (potência de 2 para indexar com máscara)
+UA_RING_SIZE = 1024
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Formato ISO 8601 dos timestamps em CSV/SQLite (o mesmo de datetime.isoformat())
+ISO_DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+
+# Limite de parâmetros por statement em SQLite < 3.32
+SQLITE_MAX_VARIABLES = 999
+
+# Charset declarado no header Content-Type
+CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([^"\';\s]+)', re.IGNORECASE)
+
+# Análise de texto
+WORD_RE = re.compile(r'\b\w+\b')
+STOP_WORDS = frozenset({'de', 'da', 'do', 'com', 'para', 'em', 'e', 'o', 'a', 'os', 'as', 'um', 'uma'})
+
+# Dados base para a geração de amostras simuladas
+SAMPLE_COMPANIES = (
+    "TechCorp", "InnovaSoft", "DataSolutions", "CloudTech", 
+    "StartupXYZ", "MegaCorp", "DigitalLabs", "CodeFactory"
+)
+SAMPLE_LEVELS = ("Júnior", "Pleno", "Sênior")
+SAMPLE_SALARIES = (3000, 4500, 6000, 8000, 10000, 12000)
+SAMPLE_BASE_PRODUCTS = {
+    'eletrônicos': ('Smartphone', 'Tablet', 'Notebook', 'Fone', 'Câmera'),
+    'roupas': ('Camiseta', 'Calça', 'Vestido', 'Casaco', 'Tênis'),
+    'casa': ('Mesa', 'Cadeira', 'Sofá', 'Cama', 'Geladeira'),
+    'livros': ('Romance', 'Técnico', 'Biografia', 'Ficção', 'História')
+}
+SAMPLE_GENERIC_PRODUCTS = ('Produto Genérico',)
+SAMPLE_AVAILABILITY = ('Em estoque', 'Últimas unidades', 'Indisponível')
+SAMPLE_BRANDS = ('A', 'B', 'C', 'D')
+SAMPLE_SOURCES = ("TechNews", "InfoDaily", "TechCrunch Brasil", "StartupBR", "DevNews")
+
 @dataclass
 class ScrapingConfig:
     """Configuração para scraping"""
     delay: float = 1.0  # Delay entre requests
     timeout: int = 10
     max_retries: int = 3
+    concurrency: int = 8  # Requests simultâneos
     use_random_agent: bool = True
     output_format: str = 'csv'  # csv, json, excel, sqlite
     output_path: str = 'scraped_data'
+    parse_only: Optional[SoupStrainer] = None  # Sobrescreve o strainer padrão do scraper
+    cache_ttl: int = 3600  # Validade do cache HTTP em segundos (0 = sem cache)
+
+class TokenBucket:
+    """Token bucket thread-safe para limitar a taxa de requests"""
+    
+    def __init__(self, rate: Optional[float], capacity: float = 1.0):
+        self.rate = rate  # Tokens por segundo (None = sem limite)
+        self.capacity = capacity
+        self.tokens = capacity  # Começa cheio: o primeiro request não espera
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Reserva um token e retorna quantos segundos esperar por ele"""
+        if not self.rate:
+            return 0.0
+        
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            
+            # Saldo negativo = fila de reservas; cada uma espera a sua vez
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+    
+    def acquire(self):
+        """Bloqueia até haver um token disponível"""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """Versão assíncrona de acquire, sem bloquear o event loop"""
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter que só aplica o rate limiting quando o request vai para a rede"""
+    
+    def __init__(self, get_bucket: Callable[[str], TokenBucket], **kwargs):
+        self.get_bucket = get_bucket
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        # O CachedSession responde cache hits sem chegar ao adapter
+        self.get_bucket(request.url).acquire()
+        return super().send(request, **kwargs)
+
+class RateLimitedAsyncTransport(httpx.AsyncBaseTransport):
+    """Transport httpx que só aplica o rate limiting quando o request vai para a rede"""
+    
+    def __init__(self, transport: httpx.AsyncBaseTransport, get_bucket: Callable[[str], TokenBucket],
+                 semaphore: asyncio.Semaphore):
+        self.transport = transport
+        self.get_bucket = get_bucket
+        self.semaphore = semaphore
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # Fica abaixo do cache do hishel, que responde cache hits sem chegar aqui.
+        # Espera o token antes de ocupar um slot, para não bloquear outros hosts
+        await self.get_bucket(str(request.url)).acquire_async()
+        
+        async with self.semaphore:
+            return await self.transport.handle_async_request(request)
+    
+    async def aclose(self):
+        await self.transport.aclose()
 
 class WebScraper:
     """Classe base para web scraping"""
     
+    # Parseia só as tags relevantes para o scraper (None = documento inteiro)
+    parse_only: Optional[SoupStrainer] = None
+    
+    # Tipos das colunas do DataFrame (evita a inferência do pandas e reduz memória)
+    dtypes: Dict[str, str] = {'scraped_at': 'datetime64[ns]'}
+    
     def __init__(self, config: ScrapingConfig):
         self.config = config
-        self.session = requests.Session()
+        self.session = self._create_session()
+        
         self.ua = UserAgent() if config.use_random_agent else None
+        
+        # Sorteia os user agents uma única vez; cada request só avança o índice
+        self._ua_ring = random.choices(self._load_ua_pool(), k=UA_RING_SIZE) if self.ua else []
+        self._ua_idx = 0
         self.scraped_data = []
+        self.df: Optional[pd.DataFrame] = None
+        
+        # Rate limiting por host, compartilhado entre threads
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
         
         # Headers padrão
         self.headers = {
             'User-Agent': self.get_user_agent(),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': ACCEPT_ENCODING,  # Inclui br quando brotli está instalado
             'Connection': 'keep-alive',
         }
-        self.session.headers.update(self.headers)
+        if self.session is not None:
+            self.session.headers.update(self.headers)
+    
+    @property
+    def cache_path(self) -> Path:
+        """Diretório do cache HTTP em disco"""
+        return Path(self.config.output_path) / '.http_cache'
+    
+    def _create_session(self) -> Optional[requests.Session]:
+        """Cria a sessão HTTP, com cache em SQLite se cache_ttl > 0"""
+        if not self.config.cache_ttl:
+            session = requests.Session()
+        else:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            session = requests_cache.CachedSession(
+                str(self.cache_path),
+                backend='sqlite',
+                expire_after=self.config.cache_ttl
+            )
+        
+        # Pool de conexões do tamanho da concorrência e retries dentro do urllib3
+        retry = Retry(
+            # total conta retries; max_retries no config conta tentativas (como no async)
+            total=max(0, self.config.max_retries - 1),
+            backoff_factor=self.config.delay,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD', 'POST']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = RateLimitedAdapter(
+            self.get_bucket,
+            pool_connections=self.config.concurrency,
+            pool_maxsize=self.config.concurrency,
+            max_retries=retry
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        
+        return session
+    
+    def _load_ua_pool(self) -> tuple:
+        """Carrega a lista de user agents do fake_useragent uma única vez"""
+        data = getattr(self.ua, 'data_browsers', None)
+        
+        if isinstance(data, dict):  # fake-useragent < 1.5: {browser: [ua, ...]}
+            pool = [agent for agents in data.values() for agent in agents]
+        elif isinstance(data, list):  # fake-useragent >= 1.5: [{'useragent': ...}, ...]
+            pool = [item['useragent'] for item in data if 'useragent' in item]
+        else:
+            pool = []
+        
+        return tuple(pool) or (self.ua.random,)
     
     def get_user_agent(self) -> str:
         """Retorna user agent"""
-        if self.ua:
-            return self.ua.random
-        return 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        if self._ua_ring:
+            self._ua_idx = (self._ua_idx + 1) & (UA_RING_SIZE - 1)
+            return self._ua_ring[self._ua_idx]
+        return DEFAULT_USER_AGENT
+    
+    def get_bucket(self, url: str) -> TokenBucket:
+        """Retorna o token bucket do host da URL"""
+        host = urlparse(url).netloc
+        with self._buckets_lock:
+            if host not in self._buckets:
+                rate = 1 / self.config.delay if self.config.delay > 0 else None
+                self._buckets[host] = TokenBucket(rate)
+            return self._buckets[host]
     
     def make_request(self, url: str, method: str = 'GET', **kwargs) -> Optional[requests.Response]:
-        """Faz requisição com retry e delay"""
-        for attempt in range(self.config.max_retries):
-            try:
-                time.sleep(self.config.delay)
-                
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    timeout=self.config.timeout,
-                    **kwargs
-                )
-                
-                if response.status_code == 200:
-                    return response
-                else:
-                    logger.warning(f"Status {response.status_code} para {url}")
-                    
-            except Exception as e:
-                logger.warning(f"Tentativa {attempt + 1} falhou para {url}: {str(e)}")
-                
-                if attempt < self.config.max_retries - 1:
-                    time.sleep(self.config.delay * (attempt + 1))
+        """Faz requisição com retry (via urllib3) e rate limiting (via adapter)"""
+        if self.ua:
+            kwargs['headers'] = {'User-Agent': self.get_user_agent(), **(kwargs.get('headers') or {})}
         
-        logger.error(f"Falha ao acessar {url} após {self.config.max_retries} tentativas")
+        try:
+            response = self.session.request(
+                method=method,
+                url=url,
+                timeout=self.config.timeout,
+                **kwargs
+            )
+        except Exception as e:
+            logger.error(f"Falha ao acessar {url} após {self.config.max_retries} tentativas: {str(e)}")
+            return None
+        
+        if response.status_code == 200:
+            return response
+        
+        logger.warning(f"Status {response.status_code} para {url}")
         return None
     
-    def parse_html(self, html: str) -> BeautifulSoup:
-        """Parseia HTML com BeautifulSoup"""
-        return BeautifulSoup(html, 'html.parser')
+    @staticmethod
+    def get_header_charset(response: Union[requests.Response, httpx.Response]) -> Optional[str]:
+        """Retorna o charset do Content-Type, ou None se o servidor não declarou um"""
+        # response.encoding do requests cai no ISO-8859-1 da RFC quando não há
+        # charset, o que sobrescreveria o <meta charset> da página
+        match = CHARSET_RE.search(response.headers.get('Content-Type', ''))
+        if not match:
+            return None
+        
+        try:
+            return codecs.lookup(match.group(1)).name
+        except LookupError:
+            return None
     
-    def save_data(self, data: List[Dict], filename: str):
+    def parse_html(self, html: Union[str, bytes, requests.Response],
+                   encoding: Optional[str] = None) -> BeautifulSoup:
+        """Parseia HTML com BeautifulSoup (lxml, com fallback para html5lib)"""
+        # Passar os bytes crus deixa a decodificação a cargo da libxml2
+        if isinstance(html, (requests.Response, httpx.Response)):
+            encoding = encoding or self.get_header_charset(html)
+            html = html.content
+        from_encoding = encoding if isinstance(html, bytes) else None
+        parse_only = self.config.parse_only or self.parse_only
+        
+        try:
+            return BeautifulSoup(html, 'lxml', from_encoding=from_encoding, parse_only=parse_only)
+        except Exception as e:
+            logger.warning(f"lxml falhou ao parsear HTML, usando html5lib: {str(e)}")
+            # html5lib não suporta parse_only e sempre monta o documento inteiro
+            return BeautifulSoup(html, 'html5lib', from_encoding=from_encoding)
+    
+    def parse_fast(self, html: Union[str, bytes, requests.Response, httpx.Response]) -> LexborHTMLParser:
+        """Parseia HTML com selectolax para extração via seletores CSS (tree.css(...))"""
+        if isinstance(html, (requests.Response, httpx.Response)):
+            charset = self.get_header_charset(html)
+            html = html.content
+            
+            # O lexbor assume UTF-8 para bytes; outros charsets são decodificados antes,
+            # usando o header ou, sem ele, o <meta charset> da página
+            if charset != 'utf-8':
+                html = UnicodeDammit(html, [charset] if charset else [], is_html=True).unicode_markup
+        
+        return LexborHTMLParser(html)
+    
+    def to_dataframe(self, data: Union[List[Dict], pd.DataFrame]) -> pd.DataFrame:
+        """Monta o DataFrame uma única vez, com os tipos do esquema do scraper"""
+        # DataFrames também passam pelo esquema (no-op para colunas já tipadas)
+        df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        dtypes = {col: dtype for col, dtype in self.dtypes.items() if col in df.columns}
+        self.df = df.astype(dtypes)
+        return self.df
+    
+    def save_data(self, data: Union[List[Dict], pd.DataFrame], filename: str):
         """Salva dados no formato especificado"""
-        if not data:
+        if data is None or len(data) == 0:
             logger.warning("Nenhum dado para salvar")
             return
         
@@ -97,17 +338,39 @@ class WebScraper:
         filepath = Path(self.config.output_path) / filename
         
         try:
-            if self.config.output_format == 'csv':
-                df = pd.DataFrame(data)
-                df.to_csv(f"{filepath}.csv", index=False, encoding='utf-8')
+            if isinstance(data, pd.DataFrame):
+                data = self.to_dataframe(data)
+            
+            if self.config.output_format == 'csv' and isinstance(data, pd.DataFrame):
+                data.to_csv(f"{filepath}.csv", index=False, encoding='utf-8',
+                            date_format=ISO_DATETIME_FORMAT)
+                
+            elif self.config.output_format == 'csv':
+                # Escreve linha a linha, sem montar um DataFrame só para exportar
+                fieldnames = list(dict.fromkeys(key for row in data for key in row))
+                with open(f"{filepath}.csv", 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+                    writer.writeheader()
+                    writer.writerows(
+                        {key: value.isoformat() if isinstance(value, datetime) else value
+                         for key, value in row.items()}
+                        for row in data
+                    )
                 
             elif self.config.output_format == 'json':
-                with open(f"{filepath}.json", 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                if isinstance(data, pd.DataFrame):
+                    columns = [self._json_column(data[col]) for col in data.columns]
+                    data = [dict(zip(data.columns, row)) for row in zip(*columns)]
+                
+                with open(f"{filepath}.json", 'wb') as f:
+                    f.write(orjson.dumps(
+                        data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                        default=self._json_default
+                    ))
                     
             elif self.config.output_format == 'excel':
-                df = pd.DataFrame(data)
-                df.to_excel(f"{filepath}.xlsx", index=False)
+                self.to_dataframe(data).to_excel(f"{filepath}.xlsx", index=False)
                 
             elif self.config.output_format == 'sqlite':
                 self.save_to_sqlite(data, f"{filepath}.db")
@@ -117,149 +380,360 @@ class WebScraper:
         except Exception as e:
             logger.error(f"Erro ao salvar dados: {str(e)}")
     
-    def save_to_sqlite(self, data: List[Dict], db_path: str):
+    @staticmethod
+    def _json_column(series: pd.Series):
+        """Valores da coluna prontos para o orjson, com nulos (NA/NaT) como None"""
+        # Sem nulos (ou float, cujo NaN o orjson já escreve como null), mantém os
+        # escalares NumPy (int32, datetime64) para o orjson serializar
+        if not series.hasnans or series.dtype.kind == 'f':
+            return series.to_numpy()
+        return series.astype(object).where(series.notna(), None).to_numpy()
+    
+    @staticmethod
+    def _json_default(value):
+        """Serializa os tipos do pandas que o orjson não conhece"""
+        if isinstance(value, pd.Timestamp):
+            return value.isoformat()
+        raise TypeError(f"Tipo não serializável em JSON: {type(value).__name__}")
+    
+    def save_to_sqlite(self, data: Union[List[Dict], pd.DataFrame], db_path: str):
         """Salva dados em SQLite"""
+        # Converter antes de conectar: um erro no astype não deixa conexão aberta
+        df = self.to_dataframe(data)
+        
+        # SQLite não tem tipo de data: grava timestamps como texto ISO 8601
+        datetime_columns = df.select_dtypes(include='datetime').columns
+        df = df.assign(**{col: df[col].dt.strftime(ISO_DATETIME_FORMAT) for col in datetime_columns})
+        
+        # INSERTs multi-linha em lotes, respeitando o limite de parâmetros do SQLite
+        chunksize = max(1, min(500, SQLITE_MAX_VARIABLES // max(1, len(df.columns))))
+        
         conn = sqlite3.connect(db_path)
-        df = pd.DataFrame(data)
-        df.to_sql('scraped_data', conn, if_exists='replace', index=False)
-        conn.close()
+        try:
+            # WAL + synchronous=NORMAL: um fsync por transação em vez de um por escrita
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")  # ~64 MB de cache de páginas
+            
+            # Uma única transação para o lote inteiro
+            with conn:
+                df.to_sql('scraped_data', conn, if_exists='replace', index=False,
+                          method='multi', chunksize=chunksize)
+        finally:
+            conn.close()
 
 class JobScraper(WebScraper):
     """Scraper para vagas de emprego"""
     
+    parse_only = SoupStrainer('div', class_=re.compile('job|vacancy'))
+    
+    dtypes = {
+        'title': 'string',
+        'company': 'category',
+        'location': 'category',
+        'salary': 'string',
+        'description': 'string',
+        'requirements': 'string',
+        'url': 'string',
+        'posted_date': 'string',
+        'scraped_at': 'datetime64[ns]'
+    }
+    
     def scrape_jobs(self, search_terms: List[str], location: str = "São Paulo"):
         """Scrapa vagas de emprego"""
-        jobs_data = []
+        with ThreadPoolExecutor(max_workers=self.config.concurrency) as executor:
+            return list(chain.from_iterable(executor.map(lambda term: self._scrape_one(term, location), search_terms)))
+    
+    def _scrape_one(self, term: str, location: str) -> List[Dict]:
+        """Scrapa vagas de um único termo"""
+        logger.info(f"Buscando vagas para: {term}")
         
         # Exemplo com dados simulados (substitua por sites reais)
-        for term in search_terms:
-            logger.info(f"Buscando vagas para: {term}")
-            
-            # Simulação de dados de vagas
-            sample_jobs = self.generate_sample_jobs(term, location)
-            jobs_data.extend(sample_jobs)
-        
-        return jobs_data
+        return self.generate_sample_jobs(term, location)
     
     def generate_sample_jobs(self, term: str, location: str) -> List[Dict]:
         """Gera dados simulados de vagas"""
-        import random
+        # Timestamps calculados uma vez por chamada, não por registro. Os objetos
+        # datetime/date são serializados direto pelo orjson/pandas, sem strftime
+        now = datetime.now()
+        today = now.date()
         
-        companies = [
-            "TechCorp", "InnovaSoft", "DataSolutions", "CloudTech", 
-            "StartupXYZ", "MegaCorp", "DigitalLabs", "CodeFactory"
-        ]
-        
-        levels = ["Júnior", "Pleno", "Sênior"]
-        salaries = [3000, 4500, 6000, 8000, 10000, 12000]
+        # Sorteia cada coluna de uma vez e monta os registros no final
+        n = random.randint(5, 15)
+        job_levels = random.choices(SAMPLE_LEVELS, k=n)
+        job_companies = random.choices(SAMPLE_COMPANIES, k=n)
+        job_salaries = random.choices(SAMPLE_SALARIES, k=n)
         
-        jobs = []
-        for i in range(random.randint(5, 15)):
-            job = {
-                'title': f"Desenvolvedor {term} {random.choice(levels)}",
-                'company': random.choice(companies),
+        return [
+            {
+                'title': f"Desenvolvedor {term} {level}",
+                'company': company,
                 'location': location,
-                'salary': f"R$ {random.choice(salaries):,}",
+                'salary': f"R$ {salary:,}",
                 'description': f"Vaga para {term} com experiência em desenvolvimento web",
                 'requirements': f"Python, {term}, Git, SQL",
                 'url': f"https://example.com/job/{i}",
-                'posted_date': datetime.now().strftime('%Y-%m-%d'),
-                'scraped_at': datetime.now().isoformat()
+                'posted_date': today,
+                'scraped_at': now
             }
-            jobs.append(job)
-        
-        return jobs
+            for i, level, company, salary in zip(range(n), job_levels, job_companies, job_salaries)
+        ]
 
 class EcommerceScraper(WebScraper):
     """Scraper para dados de e-commerce"""
     
+    parse_only = SoupStrainer(['div', 'li', 'article'], class_=re.compile('product|item'))
+    
+    dtypes = {
+        'name': 'string',
+        'category': 'category',
+        'price': 'float64',  # Valores monetários precisam da precisão de float64
+        'rating': 'float64',
+        'reviews_count': 'Int32',  # Inteiro nullable: aceita registros sem contagem
+        'availability': 'category',
+        'brand': 'category',
+        'url': 'string',
+        'scraped_at': 'datetime64[ns]'
+    }
+    
     def scrape_products(self, categories: List[str]) -> List[Dict]:
         """Scrapa produtos de e-commerce"""
-        products_data = []
-        
-        for category in categories:
-            logger.info(f"Buscando produtos da categoria: {category}")
-            
-            # Simulação de dados de produtos
-            sample_products = self.generate_sample_products(category)
-            products_data.extend(sample_products)
+        with ThreadPoolExecutor(max_workers=self.config.concurrency) as executor:
+            return list(chain.from_iterable(executor.map(self._scrape_one, categories)))
+    
+    def _scrape_one(self, category: str) -> List[Dict]:
+        """Scrapa produtos de uma única categoria"""
+        logger.info(f"Buscando produtos da categoria: {category}")
         
-        return products_data
+        # Simulação de dados de produtos
+        return self.generate_sample_products(category)
     
     def generate_sample_products(self, category: str) -> List[Dict]:
         """Gera dados simulados de produtos"""
-        import random
+        products = SAMPLE_BASE_PRODUCTS.get(category.lower(), SAMPLE_GENERIC_PRODUCTS)
         
-        base_products = {
-            'eletrônicos': ['Smartphone', 'Tablet', 'Notebook', 'Fone', 'Câmera'],
-            'roupas': ['Camiseta', 'Calça', 'Vestido', 'Casaco', 'Tênis'],
-            'casa': ['Mesa', 'Cadeira', 'Sofá', 'Cama', 'Geladeira'],
-            'livros': ['Romance', 'Técnico', 'Biografia', 'Ficção', 'História']
-        }
+        now = datetime.now()
         
-        products = base_products.get(category.lower(), ['Produto Genérico'])
+        # Sorteia cada coluna de uma vez e monta os registros no final
+        n = random.randint(8, 20)
+        names = random.choices(products, k=n)
+        numbers = random.choices(range(1, 101), k=n)
+        prices = [round(random.uniform(50, 2000), 2) for _ in range(n)]
+        ratings = [round(random.uniform(3.0, 5.0), 1) for _ in range(n)]
+        reviews = random.choices(range(10, 501), k=n)
+        availabilities = random.choices(SAMPLE_AVAILABILITY, k=n)
+        brands = random.choices(SAMPLE_BRANDS, k=n)
         
-        product_list = []
-        for i in range(random.randint(8, 20)):
-            product = {
-                'name': f"{random.choice(products)} {random.randint(1, 100)}",
+        return [
+            {
+                'name': f"{name} {number}",
                 'category': category,
-                'price': round(random.uniform(50, 2000), 2),
-                'rating': round(random.uniform(3.0, 5.0), 1),
-                'reviews_count': random.randint(10, 500),
-                'availability': random.choice(['Em estoque', 'Últimas unidades', 'Indisponível']),
-                'brand': f"Marca {random.choice(['A', 'B', 'C', 'D'])}",
+                'price': price,
+                'rating': rating,
+                'reviews_count': reviews_count,
+                'availability': availability,
+                'brand': f"Marca {brand}",
                 'url': f"https://example.com/product/{i}",
-                'scraped_at': datetime.now().isoformat()
+                'scraped_at': now
             }
-            product_list.append(product)
-        
-        return product_list
+            for i, name, number, price, rating, reviews_count, availability, brand
+            in zip(range(n), names, numbers, prices, ratings, reviews, availabilities, brands)
+        ]
 
 class NewsScraper(WebScraper):
     """Scraper para notícias"""
     
+    parse_only = SoupStrainer('article')
+    
+    dtypes = {
+        'title': 'string',
+        'source': 'category',
+        'author': 'category',
+        'published_date': 'string',
+        'topic': 'category',
+        'summary': 'string',
+        'url': 'string',
+        'scraped_at': 'datetime64[ns]'
+    }
+    
     def scrape_news(self, topics: List[str]) -> List[Dict]:
         """Scrapa notícias"""
-        news_data = []
-        
-        for topic in topics:
-            logger.info(f"Buscando notícias sobre: {topic}")
-            
-            # Simulação de dados de notícias
-            sample_news = self.generate_sample_news(topic)
-            news_data.extend(sample_news)
+        with ThreadPoolExecutor(max_workers=self.config.concurrency) as executor:
+            return list(chain.from_iterable(executor.map(self._scrape_one, topics)))
+    
+    def _scrape_one(self, topic: str) -> List[Dict]:
+        """Scrapa notícias de um único tópico"""
+        logger.info(f"Buscando notícias sobre: {topic}")
         
-        return news_data
+        # Simulação de dados de notícias
+        return self.generate_sample_news(topic)
     
     def generate_sample_news(self, topic: str) -> List[Dict]:
         """Gera dados simulados de notícias"""
-        import random
+        # Datas possíveis de publicação (hoje até 30 dias atrás) pré-calculadas
+        now = datetime.now()
+        today = now.date()
+        dates = [today - timedelta(days=days) for days in range(31)]
         
-        sources = ["TechNews", "InfoDaily", "TechCrunch Brasil", "StartupBR", "DevNews"]
+        # Sorteia cada coluna de uma vez e monta os registros no final
+        n = random.randint(5, 12)
+        numbers = random.choices(range(1, 101), k=n)
+        news_sources = random.choices(SAMPLE_SOURCES, k=n)
+        authors = random.choices(range(1, 11), k=n)
+        published = random.choices(dates, k=n)
         
-        news_list = []
-        for i in range(random.randint(5, 12)):
-            news = {
-                'title': f"Últimas novidades sobre {topic} - {random.randint(1, 100)}",
-                'source': random.choice(sources),
-                'author': f"Autor {random.randint(1, 10)}",
-                'published_date': (datetime.now() - timedelta(days=random.randint(0, 30))).strftime('%Y-%m-%d'),
+        return [
+            {
+                'title': f"Últimas novidades sobre {topic} - {number}",
+                'source': source,
+                'author': f"Autor {author}",
+                'published_date': published_date,
                 'topic': topic,
                 'summary': f"Resumo da notícia sobre {topic}...",
                 'url': f"https://example.com/news/{i}",
-                'scraped_at': datetime.now().isoformat()
+                'scraped_at': now
             }
-            news_list.append(news)
+            for i, number, source, author, published_date
+            in zip(range(n), numbers, news_sources, authors, published)
+        ]
+
+class AsyncWebScraper(WebScraper):
+    """Classe base para web scraping assíncrono com httpx (HTTP/2)"""
+    
+    def __init__(self, config: ScrapingConfig):
+        super().__init__(config)
+        self.client: Optional[httpx.AsyncClient] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+    
+    def _create_session(self) -> Optional[requests.Session]:
+        """Requests síncronos não são usados; o cliente httpx é criado em __aenter__"""
+        return None
+    
+    async def __aenter__(self):
+        # O cliente e o semáforo precisam ser criados dentro do event loop.
+        # Com HTTP/2 os requests para o mesmo host são multiplexados numa só conexão
+        self.semaphore = asyncio.Semaphore(self.config.concurrency)
+        transport = RateLimitedAsyncTransport(
+            httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.config.concurrency,
+                    max_connections=self.config.concurrency * 2
+                )
+            ),
+            self.get_bucket,
+            self.semaphore
+        )
         
-        return news_list
+        if self.config.cache_ttl:
+            self.cache_path.mkdir(parents=True, exist_ok=True)
+            transport = hishel.AsyncCacheTransport(
+                transport=transport,
+                storage=hishel.AsyncFileStorage(base_path=self.cache_path, ttl=self.config.cache_ttl),
+                controller=hishel.Controller(force_cache=True)
+            )
+        
+        self.client = httpx.AsyncClient(
+            transport=transport,
+            headers=self.headers,
+            timeout=self.config.timeout
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.client.aclose()
+        self.client = None
+    
+    async def make_request(self, url: str, method: str = 'GET', **kwargs) -> Optional[httpx.Response]:
+        """Faz requisição assíncrona com retry e rate limiting"""
+        if self.ua:
+            kwargs['headers'] = {'User-Agent': self.get_user_agent(), **(kwargs.get('headers') or {})}
+        
+        for attempt in range(self.config.max_retries):
+            try:
+                # O rate limiting e o limite de concorrência ficam no transport
+                response = await self.client.request(method, url, **kwargs)
+                if response.status_code == 200:
+                    return response
+                logger.warning(f"Status {response.status_code} para {url}")
+                
+            except Exception as e:
+                logger.warning(f"Tentativa {attempt + 1} falhou para {url}: {str(e)}")
+                
+                if attempt < self.config.max_retries - 1:
+                    await asyncio.sleep(self.config.delay * (attempt + 1))
+        
+        logger.error(f"Falha ao acessar {url} após {self.config.max_retries} tentativas")
+        return None
+
+class AsyncJobScraper(AsyncWebScraper, JobScraper):
+    """Scraper assíncrono para vagas de emprego"""
+    
+    async def scrape_jobs(self, search_terms: List[str], location: str = "São Paulo") -> List[Dict]:
+        """Scrapa vagas de emprego concorrentemente"""
+        async def fetch(term: str) -> List[Dict]:
+            # Exemplo com dados simulados (substitua por await self.make_request(url))
+            return self._scrape_one(term, location)
+        
+        results = await asyncio.gather(*[fetch(term) for term in search_terms])
+        return list(chain.from_iterable(results))
+
+class AsyncEcommerceScraper(AsyncWebScraper, EcommerceScraper):
+    """Scraper assíncrono para dados de e-commerce"""
+    
+    async def scrape_products(self, categories: List[str]) -> List[Dict]:
+        """Scrapa produtos de e-commerce concorrentemente"""
+        async def fetch(category: str) -> List[Dict]:
+            # Exemplo com dados simulados (substitua por await self.make_request(url))
+            return self._scrape_one(category)
+        
+        results = await asyncio.gather(*[fetch(category) for category in categories])
+        return list(chain.from_iterable(results))
+
+class AsyncNewsScraper(AsyncWebScraper, NewsScraper):
+    """Scraper assíncrono para notícias"""
+    
+    async def scrape_news(self, topics: List[str]) -> List[Dict]:
+        """Scrapa notícias concorrentemente"""
+        async def fetch(topic: str) -> List[Dict]:
+            # Exemplo com dados simulados (substitua por await self.make_request(url))
+            return self._scrape_one(topic)
+        
+        results = await asyncio.gather(*[fetch(topic) for topic in topics])
+        return list(chain.from_iterable(results))
+
+async def scrape_all(config: ScrapingConfig):
+    """Executa os três scrapers concorrentemente"""
+    async with AsyncJobScraper(config) as job_scraper, \
+            AsyncEcommerceScraper(config) as ecommerce_scraper, \
+            AsyncNewsScraper(config) as news_scraper:
+        jobs_data, products_data, news_data = await asyncio.gather(
+            job_scraper.scrape_jobs(['Python', 'Django', 'JavaScript'], 'São Paulo'),
+            ecommerce_scraper.scrape_products(['eletrônicos', 'roupas', 'casa']),
+            news_scraper.scrape_news(['Python', 'IA', 'Tecnologia'])
+        )
+    
+    # Cada DataFrame é montado uma vez e reaproveitado para salvar e analisar
+    jobs_df = job_scraper.to_dataframe(jobs_data)
+    products_df = ecommerce_scraper.to_dataframe(products_data)
+    news_df = news_scraper.to_dataframe(news_data)
+    
+    job_scraper.save_data(jobs_df, 'jobs_data')
+    ecommerce_scraper.save_data(products_df, 'products_data')
+    news_scraper.save_data(news_df, 'news_data')
+    
+    return jobs_df, products_df, news_df
 
 class DataAnalyzer:
     """Classe para análise dos dados coletados"""
     
-    def __init__(self, data: List[Dict]):
+    def __init__(self, data: Union[List[Dict], pd.DataFrame]):
         self.data = data
-        self.df = pd.DataFrame(data) if data else pd.DataFrame()
+        if isinstance(data, pd.DataFrame):
+            self.df = data
+        else:
+            self.df = pd.DataFrame(data) if data else pd.DataFrame()
     
     def get_basic_stats(self) -> Dict:
         """Retorna estatísticas básicas"""
@@ -283,32 +757,35 @@ class DataAnalyzer:
         
         text_data = self.df[text_column].dropna()
         
+        # Calcula os comprimentos uma única vez e reduz direto no array NumPy
+        lengths = text_data.str.len().to_numpy(dtype='float64')
+        has_data = lengths.size > 0
+        
         analysis = {
             'total_entries': len(text_data),
-            'average_length': text_data.str.len().mean(),
-            'max_length': text_data.str.len().max(),
-            'min_length': text_data.str.len().min(),
-            'most_common_words': self.get_common_words(text_data.str.cat(sep=' '))
+            'average_length': lengths.mean() if has_data else float('nan'),
+            'max_length': int(lengths.max()) if has_data else float('nan'),
+            'min_length': int(lengths.min()) if has_data else float('nan'),
+            'most_common_words': self.get_common_words(text_data)
         }
         
         return analysis
     
-    def get_common_words(self, text: str, top_n: int = 10) -> List[tuple]:
+    def get_common_words(self, text: Union[str, Iterable[str]], top_n: int = 10) -> List[tuple]:
         """Retorna palavras mais comuns"""
-        # Limpar texto
-        words = re.findall(r'\b\w+\b', text.lower())
-        
-        # Remover stop words básicas
-        stop_words = {'de', 'da', 'do', 'com', 'para', 'em', 'e', 'o', 'a', 'os', 'as', 'um', 'uma'}
-        words = [word for word in words if word not in stop_words and len(word) > 2]
+        # Processa um texto por vez, sem concatenar a coluna inteira em memória
+        texts = [text] if isinstance(text, str) else text
         
-        # Contar frequência
-        word_count = {}
-        for word in words:
-            word_count[word] = word_count.get(word, 0) + 1
+        # Limpar texto e remover stop words básicas
+        counts = Counter()
+        for entry in texts:
+            counts.update(
+                word for word in WORD_RE.findall(entry.lower())
+                if len(word) > 2 and word not in STOP_WORDS
+            )
         
         # Retornar top N
-        return sorted(word_count.items(), key=lambda x: x[1], reverse=True)[:top_n]
+        return counts.most_common(top_n)
 
 def main():
     """Função principal para demonstração"""
@@ -322,37 +799,23 @@ def main():
         output_path='scraped_data'
     )
     
-    # 1. Scraping de Vagas de Emprego
-    print("\n💼 Scraped Jobs...")
-    job_scraper = JobScraper(config)
-    jobs_data = job_scraper.scrape_jobs(['Python', 'Django', 'JavaScript'], 'São Paulo')
-    job_scraper.save_data(jobs_data, 'jobs_data')
-    
-    # 2. Scraping de E-commerce
-    print("\n🛒 Scraping E-commerce...")
-    ecommerce_scraper = EcommerceScraper(config)
-    products_data = ecommerce_scraper.scrape_products(['eletrônicos', 'roupas', 'casa'])
-    ecommerce_scraper.save_data(products_data, 'products_data')
-    
-    # 3. Scraping de Notícias
-    print("\n📰 Scraping Notícias...")
-    news_scraper = NewsScraper(config)
-    news_data = news_scraper.scrape_news(['Python', 'IA', 'Tecnologia'])
-    news_scraper.save_data(news_data, 'news_data')
+    # 1-3. Scraping de Vagas, E-commerce e Notícias em paralelo
+    print("\n💼 Scraping Jobs, 🛒 E-commerce e 📰 Notícias...")
+    jobs_df, products_df, news_df = asyncio.run(scrape_all(config))
     
     # 4. Análise dos Dados
     print("\n📊 Análise dos Dados...")
     
     # Analisar dados de jobs
-    job_analyzer = DataAnalyzer(jobs_data)
+    job_analyzer = DataAnalyzer(jobs_df)
     job_stats = job_analyzer.get_basic_stats()
     
     print(f"✅ Jobs coletados: {job_stats.get('total_records', 0)}")
-    print(f"✅ Produtos coletados: {len(products_data)}")
-    print(f"✅ Notícias coletadas: {len(news_data)}")
+    print(f"✅ Produtos coletados: {len(products_df)}")
+    print(f"✅ Notícias coletadas: {len(news_df)}")
     
     # Análise de texto dos títulos de jobs
-    if jobs_data:
+    if not jobs_df.empty:
         text_analysis = job_analyzer.analyze_text_data('title')
         print(f"📝 Análise de títulos de vagas:")
         print(f"   - Média de caracteres: {text_analysis.get('average_length', 0):.1f}")
@@ -361,13 +824,16 @@ def main():
     # Resumo final
     print("\n🎉 Scraping Concluído!")
     print(f"📁 Dados salvos em: {config.output_path}")
-    print(f"📊 Total de registros: {len(jobs_data) + len(products_data) + len(news_data)}")
+    print(f"📊 Total de registros: {len(jobs_df) + len(products_df) + len(news_df)}")
     
     # Exemplo de uso avançado
     print("\n🔧 Exemplo de Uso Avançado:")
     print("job_scraper = JobScraper(config)")
     print("data = job_scraper.scrape_jobs(['Python Junior'], 'São Paulo')")
     print("job_scraper.save_data(data, 'python_jobs')")
+    print("\n⚡ Versão assíncrona:")
+    print("async with AsyncJobScraper(config) as job_scraper:")
+    print("    data = await job_scraper.scrape_jobs(['Python Junior'], 'São Paulo')")
 
 if __name__ == "__main__":
     main()